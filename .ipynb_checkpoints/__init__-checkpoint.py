@@ -1 +0,0 @@
-from . import agent
\ No newline at end of file
@@ -1,7 +1,6 @@
 import re
 
 from google.adk.agents import LlmAgent,SequentialAgent,Agent
-from google.adk.models.google_llm import Gemini
 from google.adk.runners import InMemoryRunner
 from google.adk.sessions import InMemorySessionService
 from google.adk.tools import google_search, AgentTool
@@ -10,41 +9,59 @@ from google.adk.code_executors import BuiltInCodeExecutor
 from google.genai import types
 from google.adk.tools.function_tool import FunctionTool
 from google.adk.apps.app import App, ResumabilityConfig
+from google.adk.agents.context_cache_config import ContextCacheConfig
 from google.adk.runners import Runner
 from google.adk.planners import BuiltInPlanner
 from google.genai.types import HttpRetryOptions, GenerateContentConfig, ThinkingConfig
 
 # Import the sub-agents
 from .sub_agents.coin_verification_agent import coin_verification_agent
-from .sub_agents.data_fetcher_agent import data_fetcher_agent
 from .sub_agents.research_agent import research_agent
+from .agent_utils import get_gemini, fetch_and_clean
 
 
 
 orchestrator_agent = Agent(
     name="orchestrator_agent",
-    model=Gemini(model="gemini-2.5-flash"),
+    model=get_gemini("gemini-2.5-flash"),
     planner=BuiltInPlanner(thinking_config=ThinkingConfig(include_thoughts=True,thinking_budget=8192)),
-    sub_agents=[coin_verification_agent, data_fetcher_agent, research_agent],
+    sub_agents=[coin_verification_agent, research_agent],
+    tools=[fetch_and_clean],
     instruction="""
     You are the Strategy Orchestrator.
     
     MANDATORY WORKFLOW:
     
     1. EXTRACT the ticker symbol (e.g., BTC, ETH) and horizon from user input.
+       - horizon is "long" for long-term analysis, investing, or similar.
+       - horizon is "short" for short-term analysis, day trading, or similar.
     
     2. CALL coin_verification_agent.
        - IF output is "REJECT": STOP immediately and inform the user the coin is invalid.
        - IF output is "PASS": Proceed to next step (step 3).
        
-    3. CALL `data_fetcher_agent`.
-       - This returns a Reference ID (UUID).
-       - If it returns "ERROR": STOP.
+    3. CALL the tool `fetch_and_clean(ticker=<ticker from step 1>, horizon=<"long" or "short">)`.
+       - The ticker MUST be the same symbol approved by coin_verification_agent.
+       - This downloads and cleans the data and returns a `reference_id` (UUID).
+       - If it returns "status": "error": STOP and report the error_message.
        
-    4. CALL `research_agent`.
+    4. CALL `research_agent` with the `reference_id`.
        - Present the strategy to the user.
     """
 )
 
 
 root_agent = orchestrator_agent
+
+# Gemini context caching: the static instructions (and tool declarations) are
+# uploaded once as cached content and reused by handle on later requests,
+# so they are not re-sent and re-prefilled on every call.
+app = App(
+    name="quant_research",
+    root_agent=root_agent,
+    context_cache_config=ContextCacheConfig(
+        min_tokens=1024,  # Below this, Gemini rejects explicit caches
+        ttl_seconds=1800,  # Keep the cache alive for 30 minutes
+        cache_intervals=10  # Refresh the cache after 10 uses
+    )
+)
@@ -2,35 +2,151 @@ import os
 import pandas as pd
 import numpy as np
 from requests import Request, Session
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, Timeout, TooManyRedirects
+from urllib3.util.retry import Retry
 import json
-import calendar
+try:
+    # Optional: orjson parses the multi-MB API payloads several times faster
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from google.adk.tools.tool_context import ToolContext
+from google.adk.models.google_llm import Gemini
+from google.genai import types
 
 from typing import List, Dict, Any, Optional, Tuple, Any
 import math
 import datetime
+import functools
+import threading
+import time
+from pathlib import Path
 
-import requests
-from scipy.stats import skew, kurtosis, jarque_bera
-import scipy.stats as stats
+from cachetools import LFUCache, TTLCache, cached
 
 
 from dotenv import load_dotenv
 
+# Load .env file once per process
+load_dotenv()
+
 # --- SHARED MEMORY ---
-# This dictionary persists across all agents
-DATA_CACHE: Dict[str, Any] = {}
+# Research results keyed by (reference_id, rows, last timestamp)
+ANALYSIS_CACHE: Dict[Tuple, Dict[str, Any]] = {}
+
+# Reference IDs whose DATA_CACHE entry has already been cleaned
+CLEANED_IDS: set = set()
+
 
+def _drop_analyses(reference_id: str) -> None:
+    """Remove every ANALYSIS_CACHE entry computed for `reference_id`."""
+    for key in [k for k in list(ANALYSIS_CACHE) if k[0] == reference_id]:
+        ANALYSIS_CACHE.pop(key, None)
+
+
+class _DataCache(LFUCache):
+    """
+    LFU-bounded store for datasets. Evicting a dataset also forgets its
+    cleaned flag and cached analyses. Access is locked because background
+    pre-warm threads read it too.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize=maxsize)
+        self._lock = threading.RLock()
+
+    def __contains__(self, key):
+        with self._lock:
+            return super().__contains__(key)
+
+    def __getitem__(self, key):
+        with self._lock:
+            return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        # Membership check and read must happen atomically, or a concurrent
+        # eviction between them would raise KeyError instead of returning default
+        with self._lock:
+            return super().get(key, default)
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        with self._lock:
+            super().__delitem__(key)
+
+    def popitem(self):
+        with self._lock:
+            reference_id, value = super().popitem()
+        CLEANED_IDS.discard(reference_id)
+        _drop_analyses(reference_id)
+        return reference_id, value
+
+
+# This cache persists across all agents (at most 64 datasets, least frequently used evicted first)
+DATA_CACHE = _DataCache(maxsize=64)
+
+# Background workers that pre-compute research statistics right after cleaning
+_PREWARM_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Analyses currently being computed, keyed like ANALYSIS_CACHE
+_INFLIGHT: Dict[Tuple, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# --- SHARED GEMINI RETRY POLICY ---
+# Exponential backoff 1s, 2s, 4s, 8s (capped) with jitter: ~15-30s worst case per call
+retry_config = types.HttpRetryOptions(
+    attempts=5,  # Maximum retry attempts
+    exp_base=2,  # Delay multiplier
+    initial_delay=1,  # Initial delay before first retry (in seconds)
+    max_delay=8,  # Upper bound for a single delay (in seconds)
+    jitter=1,  # Random extra delay to avoid synchronized retries
+    http_status_codes=[429, 500, 503, 504]  # Retry on these HTTP errors
+)
+
+# One Gemini instance (and therefore one underlying HTTP client) per model name
+_GEMINI_CLIENTS: Dict[str, Gemini] = {}
+
+def get_gemini(model: str) -> Gemini:
+    """Return the shared Gemini model for `model`, creating it on first use."""
+    if model not in _GEMINI_CLIENTS:
+        _GEMINI_CLIENTS[model] = Gemini(model=model, retry_options=retry_config)
+    return _GEMINI_CLIENTS[model]
+
+# --- SHARED HTTP SESSION ---
+# Pooled connections to CoinMarketCap / EODHD are kept alive across tool calls
+_HTTP = Session()
+_HTTP.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False  # Let the tools report the final HTTP status themselves
+    )
+))
+
+# --- EODHD DISK CACHE ---
+# Historical bars are stored on disk so repeated runs only download the trailing window
+EODHD_CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "eodhd"
+EODHD_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# CoinMarketCap listings are reused for 5 minutes across coins_info calls
+_LISTINGS_CACHE = TTLCache(maxsize=4, ttl=300)
+
+@functools.lru_cache(maxsize=8)
 def load_api_key(key_name):
     """
     Load API_KEY from environment variables or .env file.
+    The result is memoized per key name; missing keys are not cached.
     """
 
-    # Load .env file
-    load_dotenv()
-
     api_key = os.getenv(key_name)
 
     if not api_key:
@@ -42,8 +158,94 @@ def load_api_key(key_name):
     os.environ[key_name] = api_key
     return api_key
 
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+def _epoch(dt: datetime.datetime) -> int:
+    """Convert a naive UTC datetime to Unix seconds."""
+    return int((dt - _EPOCH).total_seconds())
+
+
+def _eodhd_cache_path(ticker: str, exchange: str, interval: str, start: str) -> Path:
+    """Build the on-disk cache location for an EODHD download."""
+    return EODHD_CACHE_DIR / f"{ticker}.{exchange}_{interval}_{start}.pkl"
+
+
+def _read_eodhd_cache(cache_path: Path) -> Optional[pd.DataFrame]:
+    """Return the cached DataFrame, or None if it is missing, stale or unreadable."""
+    try:
+        if time.time() - cache_path.stat().st_mtime > EODHD_CACHE_TTL:
+            return None
+        return pd.read_pickle(cache_path)
+    except Exception:
+        return None
+
+
+def _write_eodhd_cache(cache_path: Path, df: pd.DataFrame) -> None:
+    """Persist a DataFrame to the disk cache. Failures are ignored (cache is best effort)."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_pickle(cache_path)
+    except Exception:
+        pass
+
+def _as_frame(data) -> pd.DataFrame:
+    """
+    Return cached OHLCV data as a DataFrame indexed by datetime.
+    Accepts either a DataFrame (as stored in DATA_CACHE) or a list of row dicts.
+    """
+    if isinstance(data, pd.DataFrame):
+        return data
+
+    frame = pd.DataFrame(data)
+    frame.set_index('datetime', inplace=True)
+    return frame
+
+def get_records(reference_id: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Return the cached dataset for a reference ID as a list of row dicts.
+    DataFrames are only serialized here, when a caller actually needs records.
+    """
+    data = DATA_CACHE.get(reference_id)
+    if isinstance(data, pd.DataFrame):
+        return data.reset_index().to_dict(orient="records")
+    return data
+
 # --- CORE TOOLS ---
 
+@cached(_LISTINGS_CACHE, key=lambda api_key: "listings")
+def _fetch_listings(api_key: str) -> Dict[str, Tuple[float, float, str]]:
+    """
+    Download the latest CoinMarketCap listings and index them by symbol.
+
+    Returns a dict mapping each symbol to (market_cap, volume_24h, date_added).
+    The date is kept as the raw ISO string and only parsed for the requested coin.
+    When a symbol appears more than once, the first (highest ranked) listing is kept.
+    """
+
+    url = 'https://pro-api.coinmarketcap.com/v1/cryptocurrency/listings/latest'
+    parameters = {
+      'start':'1',
+      'limit':'5000'
+    }
+    headers = {
+      'Accepts': 'application/json',
+      'X-CMC_PRO_API_KEY': api_key,
+    }
+
+    response = _HTTP.get(url, params=parameters, headers=headers)
+    data = _json_loads(response.content)
+
+    listings = {}
+    for item in data['data']:
+        listings.setdefault(item['symbol'], (
+            item['quote']['USD']['market_cap'],
+            item['quote']['USD']['volume_24h'],
+            item['date_added']
+        ))
+
+    return listings
+
+
 def coins_info(coin_symbol: str, tool_context: ToolContext) -> dict:
     
     """
@@ -51,8 +253,8 @@ def coins_info(coin_symbol: str, tool_context: ToolContext) -> dict:
     predefined approval criteria.
 
     This function queries the CoinMarketCap API for the latest cryptocurrency
-    listings, constructs a pandas DataFrame containing market information, and
-    checks whether the requested coin exists. If the coin is found, it is
+    listings (cached for 5 minutes), looks up the requested coin by symbol and
+    checks whether it exists. If the coin is found, it is
     evaluated according to three rules:
 
         1. Market cap must be greater than 1 billion USD.
@@ -74,38 +276,18 @@ def coins_info(coin_symbol: str, tool_context: ToolContext) -> dict:
     
     COINMARKETCAP_API_KEY =  load_api_key("COINMARKETCAP_API_KEY")
     
-    url = 'https://pro-api.coinmarketcap.com/v1/cryptocurrency/listings/latest'
-    parameters = {
-      'start':'1',
-      'limit':'5000'
-    }
-    headers = {
-      'Accepts': 'application/json',
-      'X-CMC_PRO_API_KEY': COINMARKETCAP_API_KEY,
-    }
-    
-    session = Session()
-    session.headers.update(headers)
-    
     try:
-      response = session.get(url, params=parameters)
-      data = json.loads(response.text)
+      info = _fetch_listings(COINMARKETCAP_API_KEY).get(coin_symbol)
 
     except (ConnectionError, Timeout, TooManyRedirects) as e:
       print(e)
-    
-    df = pd.DataFrame([
-    {
-        'symbol': item['symbol'],
-        'market_cap': item['quote']['USD']['market_cap'],
-        'volume_24h': item['quote']['USD']['volume_24h'],
-        'years_from_creation': (datetime.datetime.utcnow() - datetime.datetime.fromisoformat(item['date_added'].replace("Z", ""))).days / 365
-    }
-    for item in data['data']
-    ])
+      return {
+        "symbol": coin_symbol.upper(),
+        "approved": False,
+        "reasons": f"CoinMarketCap request failed: {e}"}
     
     # CASE 1: The coin doesn't exist: the tool stops and return approved: False and reasons: The Coin is not present 
-    if coin_symbol not in df["symbol"].values:
+    if info is None:
         return {
         "symbol": coin_symbol.upper(),
         "approved": False,
@@ -114,21 +296,22 @@ def coins_info(coin_symbol: str, tool_context: ToolContext) -> dict:
 
     reasons = []
 
-    coin = df[df.symbol == coin_symbol].iloc[0]
+    market_cap, volume_24h, date_added = info
+    years_from_creation = (datetime.datetime.utcnow() - datetime.datetime.fromisoformat(date_added.replace("Z", ""))).days / 365
 
      # ---------- RULE 1: Market Cap > 1.000.000.000 ----------
     
-    if coin.market_cap  < 1_000_000_000:
+    if market_cap < 1_000_000_000:
         reasons.append("Market cap < 1B")
 
     # ---------- RULE 2: Volume 24h > 1.000.000 ----------
         
-    if coin.volume_24h < 1_000_000:
+    if volume_24h < 1_000_000:
         reasons.append("24h volume < 1M")
 
     # ---------- RULE 3: Data added at least 5 years ago ----------
 
-    if coin.years_from_creation < 5:
+    if years_from_creation < 5:
         reasons.append("Coin younger than 5 years")
 
     # ---------- FINAL RESULT ----------
@@ -262,57 +445,70 @@ def get_intraday_data(
             "error_message": "start_date must be earlier than end_date."
         }
 
-    all_chunks = []
+    # --- Load Disk Cache ---
+    # Only the windows after the last cached timestamp need to be downloaded
+    cache_path = _eodhd_cache_path(ticker, exchange, interval, start_date)
+    cached_df = _read_eodhd_cache(cache_path)
+
+    fetch_start_dt = start_dt
+    if cached_df is not None and not cached_df.empty:
+        fetch_start_dt = max(start_dt, cached_df["datetime"].max().to_pydatetime())
+
+    # --- Precompute Rolling Windows (120 days each) ---
+    windows = []
+    chunk_start_dt = fetch_start_dt
+    while chunk_start_dt < end_dt:
+        chunk_end_dt = min(chunk_start_dt + datetime.timedelta(days=120), end_dt)
+        windows.append((chunk_start_dt, chunk_end_dt))
+        chunk_start_dt = chunk_end_dt
+
+    url = f"https://eodhistoricaldata.com/api/intraday/{ticker}.{exchange}"
+
+    def fetch_chunk(window):
+        """Download one window; raises ValueError with a user-facing message on failure."""
+        chunk_start_dt, chunk_end_dt = window
+        params = {
+            "api_token": eod_api_key,
+            "interval": interval,
+            "fmt": "json",
+            "from": _epoch(chunk_start_dt),
+            "to": _epoch(chunk_end_dt)
+        }
 
-    # --- Fetch Data in Rolling Windows ---
-    try:
-        while start_dt < end_dt:
-            chunk_end_dt = min(start_dt + datetime.timedelta(days=120), end_dt)
-
-            url = f"https://eodhistoricaldata.com/api/intraday/{ticker}.{exchange}"
-            params = {
-                "api_token": eod_api_key,
-                "interval": interval,
-                "fmt": "json",
-                "from": calendar.timegm(start_dt.utctimetuple()),
-                "to": calendar.timegm(chunk_end_dt.utctimetuple())
-            }
+        resp = _HTTP.get(url, params=params)
 
-            resp = requests.get(url, params=params)
+        if resp.status_code != 200:
+            raise ValueError(f"HTTP {resp.status_code} while fetching chunk {chunk_start_dt} → {chunk_end_dt}")
 
-            if resp.status_code != 200:
-                return {
-                    "status": "error",
-                    "error_message": f"HTTP {resp.status_code} while fetching chunk {start_dt} → {chunk_end_dt}"
-                }
+        try:
+            data_chunk = _json_loads(resp.content)
+        except Exception:
+            raise ValueError("API returned non-JSON response.")
 
-            try:
-                data_chunk = resp.json()
-            except Exception:
-                return {
-                    "status": "error",
-                    "error_message": "API returned non-JSON response."
-                }
+        # If chunk is not empty → convert to DataFrame
+        if not data_chunk:
+            return None
 
-            # If chunk is not empty → convert to DataFrame
-            if data_chunk:
-                df_chunk = pd.DataFrame(data_chunk)
+        df_chunk = pd.DataFrame(data_chunk)
 
-                if "datetime" not in df_chunk.columns:
-                    return {
-                        "status": "error",
-                        "error_message": "API response missing required 'datetime' column."
-                    }
+        if "datetime" not in df_chunk.columns:
+            raise ValueError("API response missing required 'datetime' column.")
 
-                df_chunk["datetime"] = pd.to_datetime(df_chunk["datetime"])
-                all_chunks.append(df_chunk)
+        df_chunk["datetime"] = pd.to_datetime(df_chunk["datetime"])
+        return df_chunk
 
-            start_dt = chunk_end_dt
+    # --- Fetch Windows Concurrently (ex.map preserves window order) ---
+    try:
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            new_chunks = [df_chunk for df_chunk in ex.map(fetch_chunk, windows) if df_chunk is not None]
 
+    except ValueError as e:
+        return {"status": "error", "error_message": str(e)}
     except Exception as e:
         return {"status": "error", "error_message": f"Unexpected error: {e}"}
 
     # --- Combine All Data ---
+    all_chunks = ([cached_df] if cached_df is not None else []) + new_chunks
     if not all_chunks:
         return {
             "status": "error",
@@ -320,7 +516,19 @@ def get_intraday_data(
         }
 
     df = pd.concat(all_chunks, ignore_index=True)
-    df = df.drop_duplicates(subset="datetime")
+    # keep="last": a re-fetched trailing bar replaces the (possibly incomplete) cached one
+    df = df.drop_duplicates(subset="datetime", keep="last")
+
+    if new_chunks:
+        _write_eodhd_cache(cache_path, df)
+
+    df = df[df["datetime"] <= end_dt]
+    if df.empty:
+        return {
+            "status": "error",
+            "error_message": "No data returned for the requested period."
+        }
+
     df = df.set_index("datetime").sort_index()
 
     # Remove fields not needed
@@ -330,8 +538,8 @@ def get_intraday_data(
 
     reference_id = str(uuid.uuid4())
     
-    # Store the raw list of dicts in the global cache
-    DATA_CACHE[reference_id] = df.reset_index().to_dict(orient="records")
+    # Store the DataFrame itself in the global cache (no per-row dict conversion)
+    DATA_CACHE[reference_id] = df
     
     return {
         "status": "success",
@@ -396,61 +604,69 @@ def get_ohlcv(
     # ---------------------------------------
     # Determine date range
     # ---------------------------------------
-    period_end = datetime.datetime.today(),
-    start = datetime.date(2000, 1, 1),
+    period_end = datetime.date.today().isoformat()
+    start = "2000-01-01"
 
     # ---------------------------------------
-    # API Request
+    # Disk cache (daily bars, refreshed every 24h)
     # ---------------------------------------
-    url = f"https://eodhistoricaldata.com/api/eod/{ticker}.{exchange}"
-    params = {
-        "api_token": EODHD_API_KEY,
-        "fmt": "json",
-        "from": start,
-        "to": period_end
-    }
-
-    try:
-        resp = requests.get(url, params=params)
-    except Exception as e:
-        return {
-            "status": "error",
-            "error_message": f"Network request failed: {e}"
+    cache_path = _eodhd_cache_path(ticker, exchange, "1d", start)
+    df = _read_eodhd_cache(cache_path)
+    from_network = df is None
+
+    if from_network:
+        # ---------------------------------------
+        # API Request
+        # ---------------------------------------
+        url = f"https://eodhistoricaldata.com/api/eod/{ticker}.{exchange}"
+        params = {
+            "api_token": EODHD_API_KEY,
+            "fmt": "json",
+            "from": start,
+            "to": period_end
         }
 
-    if resp.status_code != 200:
-        return {
-            "status": "error",
-            "error_message": f"EODHD API returned HTTP {resp.status_code}"
-        }
+        try:
+            resp = _HTTP.get(url, params=params)
+        except Exception as e:
+            return {
+                "status": "error",
+                "error_message": f"Network request failed: {e}"
+            }
 
-    # ---------------------------------------
-    # Parse JSON
-    # ---------------------------------------
-    try:
-        data_json = resp.json()
-    except Exception:
-        return {
-            "status": "error",
-            "error_message": "API returned invalid JSON."
-        }
+        if resp.status_code != 200:
+            return {
+                "status": "error",
+                "error_message": f"EODHD API returned HTTP {resp.status_code}"
+            }
 
-    if not data_json:
-        return {
-            "status": "error",
-            "error_message": "No data returned from API."
-        }
+        # ---------------------------------------
+        # Parse JSON
+        # ---------------------------------------
+        try:
+            data_json = _json_loads(resp.content)
+        except Exception:
+            return {
+                "status": "error",
+                "error_message": "API returned invalid JSON."
+            }
 
-    # ---------------------------------------
-    # Build DataFrame
-    # ---------------------------------------
-    try:
-        df = pd.DataFrame(data_json)
-    except Exception as e:
-        return {
-            "status": "error",
-            "error_message": f"Failed to convert JSON to DataFrame: {e}"
-        }
+        if not data_json:
+            return {
+                "status": "error",
+                "error_message": "No data returned from API."
+            }
+
+        # ---------------------------------------
+        # Build DataFrame
+        # ---------------------------------------
+        try:
+            df = pd.DataFrame(data_json)
+        except Exception as e:
+            return {
+                "status": "error",
+                "error_message": f"Failed to convert JSON to DataFrame: {e}"
+            }
 
     # Validate required columns
     if "date" not in df.columns:
@@ -459,6 +675,10 @@ def get_ohlcv(
             "error_message": "Missing 'date' field in API response."
         }
 
+    # Only cache responses that passed validation
+    if from_network:
+        _write_eodhd_cache(cache_path, df)
+
     # Clean DataFrame
     try:
         df.set_index("date", inplace=True)
@@ -473,8 +693,8 @@ def get_ohlcv(
 
     reference_id = str(uuid.uuid4())
     
-    # Store the raw list of dicts in the global cache
-    DATA_CACHE[reference_id] = df.reset_index().to_dict(orient="records")
+    # Store the DataFrame itself in the global cache (no per-row dict conversion)
+    DATA_CACHE[reference_id] = df
     
     return {
         "status": "success",
@@ -505,7 +725,8 @@ def clean_dataframe(
     Parameters
     ----------
     df : dict
-    A dictionary containing a "data" field with a list of OHLCV rows.
+    A dictionary containing a "data" field with a list of OHLCV rows,
+    a DataFrame, or the reference_id of a dataset stored in DATA_CACHE.
     Example:
     {
         "data": [
@@ -529,7 +750,7 @@ def clean_dataframe(
        
         {
             "status": "success",
-            "clean_df": <list of dict rows>,
+            "clean_df": <list of dict rows, or a DataFrame if a DataFrame / reference_id was given>,
             "report": [...]
         }
         OR
@@ -542,16 +763,22 @@ def clean_dataframe(
     # ---------------------------
     # Validate input
     # ---------------------------
-    dataframe = pd.DataFrame(df['data'])
-    dataframe.set_index('datetime',inplace=True)
+    source = df['data']
+    if isinstance(source, str):
+        source = DATA_CACHE.get(source)
+        if source is None:
+            return {"status": "error", "error_message": f"Reference ID '{df['data']}' not found."}
+
+    dataframe = _as_frame(source)
     if not isinstance(dataframe, pd.DataFrame):
         return {"status": "error", "error_message": "Input must be a pandas DataFrame."}
 
     if dataframe.empty:
         return {"status": "error", "error_message": "DataFrame is empty."}
 
-    # Copy to avoid mutation
-    data = dataframe.copy()
+    # Copy to avoid mutation, casting OHLCV to contiguous float64 columns in the same step
+    ohlcv_dtypes = {c: "float64" for c in dataframe.columns if c in ("open", "high", "low", "close", "volume")}
+    data = dataframe.astype(ohlcv_dtypes)
     report = []
 
     # ---------------------------
@@ -592,65 +819,61 @@ def clean_dataframe(
     # ---------------------------
     # Detect missing timestamps
     # ---------------------------
-    full_index = pd.date_range(start=data.index.min(), end=data.index.max(), freq=freq)
-    missing = full_index.difference(data.index)
+    full_index = pd.date_range(start=data.index.min(), end=data.index.max(), freq=freq, name=data.index.name)
+
+    # Both indexes are sorted and unique here: compare int64 ns with a binary search
+    full_ns, cur_ns = full_index.asi8, data.index.asi8
+    pos = np.minimum(np.searchsorted(cur_ns, full_ns), len(cur_ns) - 1)
+    missing_count = int((cur_ns[pos] != full_ns).sum())
 
-    if len(missing) > 0:
-        report.append(f"Found {len(missing)} missing timestamps.")
+    if missing_count > 0:
+        report.append(f"Found {missing_count} missing timestamps.")
         data = data.reindex(full_index)
         report.append("Reindexed DataFrame to a complete timeline.")
 
     # ---------------------------
     # Handle infinite values
     # ---------------------------
-    if np.isinf(data.values).any():
+    # Column-wise check stops at the first column with an inf and avoids copying a mixed-dtype block
+    has_inf = any(np.isinf(data[c].to_numpy()).any() for c in data.select_dtypes("number").columns)
+    if has_inf:
         data.replace([np.inf, -np.inf], np.nan, inplace=True)
         report.append("Replaced infinite values with NaN.")
 
     # ---------------------------
     # Detect & remove negative/zero OHLC
     # ---------------------------
-    ohlc_cols = [c for c in data.columns if c.lower() in ["open", "high", "low", "close"]]
-    for col in ohlc_cols:
-        bad_count = (data[col] <= 0).sum()
-        if bad_count > 0:
-            data.loc[data[col] <= 0, col] = np.nan
-            report.append(f"Column '{col}' had {bad_count} zero/negative values → set to NaN.")
+    ohlc_cols = [c for c in data.columns if c.lower() in ("open", "high", "low", "close")]
+    # Column positions inside the OHLC block, reused by the repair step below
+    col_idx = {c.lower(): i for i, c in enumerate(ohlc_cols)}
+    ohlc = data[ohlc_cols].to_numpy(dtype=np.float64)
+    mask = ohlc <= 0
+    if mask.any():
+        ohlc[mask] = np.nan
+        data[ohlc_cols] = ohlc
+        for col, bad_count in zip(ohlc_cols, mask.sum(axis=0)):
+            if bad_count > 0:
+                report.append(f"Column '{col}' had {bad_count} zero/negative values → set to NaN.")
 
     # ---------------------------
     # Fix bad OHLC relationships (optional)
     # ---------------------------
-    if repair_ohlc:
-        for idx, row in data[ohlc_cols].iterrows():
-            if row.isna().any():
-                continue
-
-            low, high = row["low"], row["high"]
-            open_, close = row["open"], row["close"]
-
-            broken = False
-            if low > high:
-                low, high = min(low, high), max(low, high)
-                broken = True
-            if open_ > high:
-                open_ = high
-                broken = True
-            if close > high:
-                close = high
-                broken = True
-            if open_ < low:
-                open_ = low
-                broken = True
-            if close < low:
-                close = low
-                broken = True
-
-            if broken:
-                data.at[idx, "low"] = low
-                data.at[idx, "high"] = high
-                data.at[idx, "open"] = open_
-                data.at[idx, "close"] = close
-                report.append(f"Repaired inconsistent OHLC at {idx}.")
+    if repair_ohlc and len(col_idx) == 4:
+        o, h, l, c = (ohlc[:, col_idx[k]] for k in ("open", "high", "low", "close"))
+        valid = ~(np.isnan(o) | np.isnan(h) | np.isnan(l) | np.isnan(c))
+
+        new_l = np.minimum(l, h)
+        new_h = np.maximum(l, h)
+        new_o = np.clip(o, new_l, new_h)
+        new_c = np.clip(c, new_l, new_h)
+
+        broken = valid & ((new_l != l) | (new_h != h) | (new_o != o) | (new_c != c))
+        broken_count = int(broken.sum())
+
+        if broken_count > 0:
+            for k, old_vals, new_vals in (("low", l, new_l), ("high", h, new_h), ("open", o, new_o), ("close", c, new_c)):
+                data[ohlc_cols[col_idx[k]]] = np.where(broken, new_vals, old_vals)
+            report.append(f"Repaired inconsistent OHLC in {broken_count} rows.")
 
     # ---------------------------
     # Clean volume column
@@ -667,24 +890,104 @@ def clean_dataframe(
     # ---------------------------
     missing_after = data.isna().sum().sum()
     if missing_after > 0:
-        data.interpolate(method="time", inplace=True)
-        data.fillna(method="ffill", inplace=True)
-        data.fillna(method="bfill", inplace=True)
-        report.append("Interpolated remaining missing values (time, ffill, bfill).")
+        # Integer columns (e.g. volume) must be float to hold interpolated values
+        data = data.astype({c: "float64" for c in data.select_dtypes(include="number").columns})
+        # limit_direction="both" also fills leading/trailing gaps in the same pass
+        data.interpolate(method="time", limit_direction="both", inplace=True)
+        report.append("Interpolated remaining missing values (time, both directions).")
 
     # ---------------------------
     # SUCCESS: return clean data
     # ---------------------------
     return {
         "status": "success",
-        "clean_df": data.reset_index().to_dict(orient="records"),
+        "clean_df": data if isinstance(source, pd.DataFrame) else data.reset_index().to_dict(orient="records"),
         "report": report
     }
 
 
+def clean_cached_data(reference_id: str) -> dict:
+    """Cleans the dataset stored under `reference_id` in place (once per ID)."""
+    if DATA_CACHE.get(reference_id) is None:
+        return {"status": "error", "error_message": f"Reference ID '{reference_id}' not found."}
+
+    # Retries on the same ID skip the cleaning work
+    if reference_id in CLEANED_IDS:
+        return {"status": "success", "reference_id": reference_id, "note": "Data already clean"}
+
+    # Clean (works directly on the cached DataFrame, no records round-trip)
+    result = clean_dataframe({"data": reference_id})
+    if result["status"] != "success":
+        return result
+
+    # Update the SAME reference ID with cleaned data
+    DATA_CACHE[reference_id] = result['clean_df']
+    CLEANED_IDS.add(reference_id)
+
+    # Drop any analysis computed on the previous version of this dataset
+    _drop_analyses(reference_id)
+
+    return {"status": "success", "reference_id": reference_id, "note": "Data cleaned in-place"}
+
+
+def fetch_and_clean(ticker: str, horizon: str) -> dict:
+    """
+    Download historical data for a crypto ticker and clean it in a single call.
+
+    Parameters
+    ----------
+    ticker : str
+        Crypto ticker symbol, e.g. "BTC-USD". A bare symbol ("BTC") is
+        converted to "<TICKER>-USD".
+    horizon : str
+        "long"  → daily OHLCV bars (get_ohlcv).
+        "short" → hourly intraday bars (get_intraday_data).
+
+    Returns
+    -------
+    dict
+        {
+            "status": "success",
+            "reference_id": "<uuid of the cleaned dataset in DATA_CACHE>",
+            "message": "..."
+        }
+        OR
+        {
+            "status": "error",
+            "error_message": "..."
+        }
+    """
+    horizon = horizon.strip().lower()
+    if horizon == "long":
+        fetched = get_ohlcv(ticker=ticker)
+    elif horizon == "short":
+        fetched = get_intraday_data(ticker=ticker)
+    else:
+        return {
+            "status": "error",
+            "error_message": f"Invalid horizon '{horizon}'. Expected 'long' or 'short'."
+        }
+
+    if fetched["status"] != "success":
+        return fetched
+
+    cleaned = clean_cached_data(fetched["reference_id"])
+    if cleaned["status"] != "success":
+        return cleaned
+
+    # Start the research statistics now, overlapping the fetcher's final LLM turn
+    _PREWARM_POOL.submit(_prewarm_analysis, fetched["reference_id"])
+
+    return {
+        "status": "success",
+        "reference_id": fetched["reference_id"],
+        "message": fetched["message"]
+    }
+
+
 def calculate_max_drawdown(prices):
     """Calculate maximum drawdown"""
-    cumulative = prices / prices.cummax()
+    cumulative = prices / np.maximum.accumulate(prices)
     return (1 - cumulative.min())
 
 def return_distribution_analysis(df: dict, time_1: int = 60, time_2: int = 252) -> dict:
@@ -692,33 +995,40 @@ def return_distribution_analysis(df: dict, time_1: int = 60, time_2: int = 252)
     Analyzes return distribution and returns a dictionary of statistics 
     for the LLM to interpret.
     """
+    # scipy is imported lazily: it is only needed here and is slow to load
+    from scipy.stats import skew, kurtosis, jarque_bera
+
     # Data Prep
-    data = pd.DataFrame(df['data'])
-    data.set_index('datetime', inplace=True)
-    data.index = pd.to_datetime(data.index)
+    data = _as_frame(df['data'])
     
-    # Calculate Returns
-    dataframe = pd.DataFrame(data['close'].copy())
-    dataframe['returns'] = np.log(dataframe / dataframe.shift(1))
-    dataframe.dropna(inplace=True)
+    # Calculate Returns (NumPy arrays, aligned: returns[i] is the return into close[i])
+    close = data['close'].to_numpy(dtype=np.float64)
+    returns = np.log(close[1:] / close[:-1])
+    close = close[1:]
+
+    valid = ~np.isnan(returns)
+    if not valid.all():
+        returns, close = returns[valid], close[valid]
 
     # --- Helper to build stats dict for a specific window ---
-    def get_stats(window_df, prices):
-        ext_threshold = 2 * window_df.std()
+    def get_stats(r, prices):
+        n = r.size
+        std = r.std(ddof=1)
+        ext_threshold = 2 * std
         return {
-            "mean_daily_return_pct": round(window_df.mean() * 100, 4),
-            "annualized_volatility_pct": round(window_df.std() * np.sqrt(365) * 100, 4),
-            "skewness": round(skew(window_df), 4),
-            "kurtosis": round(kurtosis(window_df), 4),
-            "extreme_up_moves_pct": round(len(window_df[window_df > ext_threshold]) / len(window_df) * 100, 2),
-            "extreme_down_moves_pct": round(len(window_df[window_df < -ext_threshold]) / len(window_df) * 100, 2),
+            "mean_daily_return_pct": round(r.mean() * 100, 4),
+            "annualized_volatility_pct": round(std * np.sqrt(365) * 100, 4),
+            "skewness": round(skew(r), 4),
+            "kurtosis": round(kurtosis(r), 4),
+            "extreme_up_moves_pct": round((r > ext_threshold).sum() / n * 100, 2),
+            "extreme_down_moves_pct": round((r < -ext_threshold).sum() / n * 100, 2),
             "max_drawdown_pct": round(calculate_max_drawdown(prices) * 100, 2),
-            "normality_p_value": round(stats.jarque_bera(window_df)[1], 4)
+            "normality_p_value": round(jarque_bera(r)[1], 4)
         }
 
-    # Calculate stats for both timeframes
-    stats_short = get_stats(dataframe['returns'].tail(time_1), dataframe['close'].tail(time_1))
-    stats_long = get_stats(dataframe['returns'].tail(time_2), dataframe['close'].tail(time_2))
+    # Calculate stats for both timeframes (slices are views, no copies)
+    stats_short = get_stats(returns[-time_1:], close[-time_1:])
+    stats_long = get_stats(returns[-time_2:], close[-time_2:])
 
     # Note: We keep the plotting logic if you run this locally to see the graph, 
     # but strictly speaking, the Agent doesn't see the graph, only the dict below.
@@ -736,39 +1046,42 @@ def autocorrelation_analysis(df: dict, max_lag: int = 10, time_1: int = 60, time
     Computes autocorrelation of log returns across two time windows and 
     returns structured statistics for an LLM agent to interpret.
     """
-    import numpy as np
-    import pandas as pd
 
     # ---- Data Preparation ----
-    data = pd.DataFrame(df['data'])
-    data.set_index('datetime', inplace=True)
-    data.index = pd.to_datetime(data.index)
+    data = _as_frame(df['data'])
 
     # Extract close prices and compute log returns
-    dataframe = pd.DataFrame(data['close'].copy())
-    dataframe['log_returns'] = np.log(dataframe['close'] / dataframe['close'].shift(1))
-    dataframe.dropna(inplace=True)
+    # (float64 columns are read without copying the shared cached frame)
+    close = data['close'].to_numpy(dtype=np.float64)
+    log_returns = np.log(close[1:] / close[:-1])
+    log_returns = log_returns[~np.isnan(log_returns)]
 
     # Define lags
     lags = list(range(1, max_lag + 1))
 
+    # Helper: Pearson correlation of r[t] with r[t-lag] (same as pandas Series.autocorr)
+    def autocorr(r, lag):
+        if r.size <= lag + 1:
+            return float("nan")
+        return np.corrcoef(r[lag:], r[:-lag])[0, 1]
+
     # Helper: compute autocorrelations for a timeframe
-    def get_autocorr_stats(series):
+    def get_autocorr_stats(r):
         return {
-            f"lag_{lag}": round(series.autocorr(lag=lag), 6)
+            f"lag_{lag}": round(autocorr(r, lag), 6)
             for lag in lags
         }
 
-    # Extract windows
-    short_returns = dataframe['log_returns'].tail(time_1)
-    long_returns  = dataframe['log_returns'].tail(time_2)
+    # Extract windows (views into the same returns array)
+    short_returns = log_returns[-time_1:]
+    long_returns  = log_returns[-time_2:]
 
     # Compute autocorrelations
     stats_short = get_autocorr_stats(short_returns)
     stats_long  = get_autocorr_stats(long_returns)
 
     # Approximate 95% significance band (based on long sample)
-    conf_band = round(1.96 / np.sqrt(len(dataframe['log_returns'])), 6)
+    conf_band = round(1.96 / np.sqrt(len(log_returns)), 6)
 
     # Return machine-readable dictionary
     return {
@@ -795,5 +1108,59 @@ def autocorrelation_analysis(df: dict, max_lag: int = 10, time_1: int = 60, time
     }
 
 
+def analyze_cached_data(reference_id: str) -> dict:
+    """
+    Reads cached dataset by ID, runs BOTH statistical analyses, 
+    and returns a combined dict to the agent.
+    Results are memoized per reference_id and data fingerprint, and
+    identical in-flight requests share one computation.
+    """
+    data = DATA_CACHE.get(reference_id)
+    if data is None:
+        return {"status": "error", "msg": "ID not found"}
+
+    key = (reference_id, len(data), getattr(data.index[-1], "value", None) if len(data) else None)
 
+    # Concurrent callers for the same dataset wait on a single computation
+    with _INFLIGHT_LOCK:
+        if key in ANALYSIS_CACHE:
+            return ANALYSIS_CACHE[key]
+        future = _INFLIGHT.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = _INFLIGHT[key] = Future()
 
+    if not is_owner:
+        return future.result()
+
+    try:
+        # Both analyses only read the cached frame, so they can run side by side
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            dist_future = ex.submit(return_distribution_analysis, {"data": data})
+            autocorr_future = ex.submit(autocorrelation_analysis, {"data": data})
+            dist_stats, autocorr_stats = dist_future.result(), autocorr_future.result()
+
+        result = {
+            "status": "success",
+            "distribution": dist_stats,
+            "autocorrelation": autocorr_stats
+        }
+        ANALYSIS_CACHE[key] = result
+        future.set_result(result)
+        return result
+
+    except Exception as e:
+        future.set_exception(e)
+        raise
+
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+
+def _prewarm_analysis(reference_id: str) -> None:
+    """Background job: fill ANALYSIS_CACHE so the research agent gets an instant hit."""
+    try:
+        analyze_cached_data(reference_id)
+    except Exception:
+        pass  # The research agent recomputes (and reports errors) on demand
@@ -1,3 +1,2 @@
 from . import coin_verification_agent
-from . import data_fetcher_agent
 from . import research_agent
\ No newline at end of file
@@ -1,31 +1,21 @@
 from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
 from google.adk.runners import InMemoryRunner
 from google.adk.sessions import InMemorySessionService
 from google.adk.tools import google_search, AgentTool
 from google.adk.tools.tool_context import ToolContext
 from google.adk.code_executors import BuiltInCodeExecutor
-from google.genai import types
 from google.adk.tools.function_tool import FunctionTool
 from google.adk.apps.app import App, ResumabilityConfig
 from google.adk.runners import Runner
 from google.adk.planners import BuiltInPlanner
 from google.genai.types import HttpRetryOptions, GenerateContentConfig, ThinkingConfig
 
-from ..agent_utils import coins_info
-
-
-retry_config=types.HttpRetryOptions(
-    attempts=5,  # Maximum retry attempts
-    exp_base=7,  # Delay multiplier
-    initial_delay=1, # Initial delay before first retry (in seconds)
-    http_status_codes=[429, 500, 503, 504] # Retry on these HTTP errors
-)
+from ..agent_utils import coins_info, get_gemini
 
 
 coin_verification_agent = LlmAgent(
     name="coin_verification_agent",
-    model=Gemini(model="gemini-2.5-flash-lite", retry_options=retry_config),
+    model=get_gemini("gemini-2.5-flash-lite"),
     planner=BuiltInPlanner(thinking_config=ThinkingConfig(include_thoughts=True,thinking_budget=8192)),
     tools=[coins_info],
 
@@ -1,59 +1,35 @@
 import sys
 import os
+import asyncio
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
 from google.adk.runners import InMemoryRunner
 from google.adk.sessions import InMemorySessionService
 from google.adk.tools import google_search, AgentTool
 from google.adk.tools.tool_context import ToolContext
 from google.adk.code_executors import BuiltInCodeExecutor
-from google.genai import types
 from google.adk.tools.function_tool import FunctionTool
 from google.adk.apps.app import App, ResumabilityConfig
 from google.adk.runners import Runner
 from google.adk.planners import BuiltInPlanner
 from google.genai.types import HttpRetryOptions, GenerateContentConfig, ThinkingConfig
 
-from ..agent_utils import (
-    return_distribution_analysis,
-    autocorrelation_analysis,
-    DATA_CACHE
-)
+from ..agent_utils import analyze_cached_data, get_gemini
 
 # -------------------------------------------------------------------
 # -----------------------  MEDIATOR TOOL  ---------------------------
 # -------------------------------------------------------------------
 
-def _analyze_by_id(reference_id: str) -> dict:
+async def _analyze_by_id(reference_id: str) -> dict:
     """
     Reads cached dataset by ID, runs BOTH statistical analyses, 
     and returns a combined dict to the agent.
+    Results may already be pre-computed by the data fetcher; the work runs
+    in a worker thread so the event loop is not blocked while waiting.
     """
-    data = DATA_CACHE.get(reference_id)
-    if not data:
-        return {"status": "error", "msg": "ID not found"}
-    
-    dist_stats = return_distribution_analysis({"data": data})
-    autocorr_stats = autocorrelation_analysis({"data": data})
-
-    return {
-        "status": "success",
-        "distribution": dist_stats,
-        "autocorrelation": autocorr_stats
-    }
-
-# -------------------------------------------------------------------
-# ----------------------- RETRY / MODEL CONFIG ----------------------
-# -------------------------------------------------------------------
-
-retry_config = types.HttpRetryOptions(
-    attempts=5,
-    exp_base=7,
-    initial_delay=1,
-    http_status_codes=[429, 500, 503, 504]
-)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, analyze_cached_data, reference_id)
 
 # -------------------------------------------------------------------
 # -----------------------   THE LLM AGENT   -------------------------
@@ -61,10 +37,7 @@ retry_config = types.HttpRetryOptions(
 
 research_agent = LlmAgent(
     name="research_agent",
-    model=Gemini(
-        model="gemini-2.5-flash",
-        retry_options=retry_config
-    ),
+    model=get_gemini("gemini-2.5-flash"),
     planner=BuiltInPlanner(
         thinking_config=ThinkingConfig(
             include_thoughts=True,